@@ -1,8 +1,8 @@
 """The qbittorrent component."""
+import asyncio
 import logging
 
-from qbittorrent.client import LoginRequired
-from requests.exceptions import RequestException
+from aiohttp import ClientError
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
@@ -10,13 +10,15 @@ from homeassistant.const import (
     CONF_URL,
     CONF_USERNAME,
     CONF_VERIFY_SSL,
+    EVENT_HOMEASSISTANT_CLOSE,
     Platform,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 
 from .const import DOMAIN
-from .helpers import setup_client
+from .coordinator import QBittorrentDataCoordinator
+from .helpers import LoginRequired, setup_client
 
 PLATFORMS = [Platform.SENSOR]
 
@@ -27,8 +29,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up qBittorrent from a config entry."""
     hass.data.setdefault(DOMAIN, {})
     try:
-        hass.data[DOMAIN][entry.entry_id] = await hass.async_add_executor_job(
-            setup_client,
+        client = await setup_client(
+            hass,
             entry.data[CONF_URL],
             entry.data[CONF_USERNAME],
             entry.data[CONF_PASSWORD],
@@ -37,10 +39,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     except LoginRequired as err:
         _LOGGER.error("Invalid credentials")
         raise ConfigEntryNotReady from err
-    except RequestException as err:
+    except (ClientError, asyncio.TimeoutError) as err:
         _LOGGER.error("Failed to connect")
         raise ConfigEntryNotReady from err
 
+    coordinator = QBittorrentDataCoordinator(hass, client)
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except ConfigEntryNotReady:
+        await client.close()
+        raise
+    hass.data[DOMAIN][entry.entry_id] = coordinator
+
+    async def _async_close_client(event: Event) -> None:
+        """Close the client session when Home Assistant shuts down."""
+        await client.close()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_client)
+    )
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
@@ -48,7 +66,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload qBittorrent config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        del hass.data[DOMAIN][entry.entry_id]
+        coordinator: QBittorrentDataCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.client.close()
         if not hass.data[DOMAIN]:
             del hass.data[DOMAIN]
     return unload_ok
@@ -1,11 +1,11 @@
 """Config flow for qBittorrent."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
-from qbittorrent.client import LoginRequired
-from requests.exceptions import RequestException
+from aiohttp import ClientError
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigFlow
@@ -19,7 +19,7 @@ from homeassistant.const import (
 from homeassistant.data_entry_flow import FlowResult
 
 from .const import DEFAULT_NAME, DEFAULT_URL, DOMAIN
-from .helpers import setup_client
+from .helpers import LoginRequired, setup_client
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -45,8 +45,8 @@ class QbittorrentConfigFlow(ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             self._async_abort_entries_match({CONF_URL: user_input[CONF_URL]})
             try:
-                await self.hass.async_add_executor_job(
-                    setup_client,
+                client = await setup_client(
+                    self.hass,
                     user_input[CONF_URL],
                     user_input[CONF_USERNAME],
                     user_input[CONF_PASSWORD],
@@ -54,9 +54,10 @@ class QbittorrentConfigFlow(ConfigFlow, domain=DOMAIN):
                 )
             except LoginRequired:
                 errors = {"base": "invalid_auth"}
-            except RequestException:
+            except (ClientError, asyncio.TimeoutError):
                 errors = {"base": "cannot_connect"}
             else:
+                await client.close()
                 return self.async_create_entry(title=DEFAULT_NAME, data=user_input)
 
         schema = self.add_suggested_values_to_schema(USER_DATA_SCHEMA, user_input)
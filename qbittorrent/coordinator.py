@@ -0,0 +1,166 @@
+"""Data update coordinator for qBittorrent."""
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+import logging
+from typing import Any
+
+from aiohttp import ClientError
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import DOMAIN
+from .helpers import LoginRequired, QBittorrentClient
+
+_LOGGER = logging.getLogger(__name__)
+
+UPDATE_INTERVAL = timedelta(seconds=30)
+
+GROUP_DOWNLOADING = "downloading"
+GROUP_PAUSED = "paused"
+GROUP_SEEDING = "seeding"
+
+# The only torrent fields the sensors use; everything else is dropped on merge.
+TORRENT_FIELDS = ("state", "size", "downloaded", "eta")
+
+# Torrent states that count towards a sensor, keyed to the group they count as.
+# "forceDL" is not a state qBittorrent reports but is kept for compatibility.
+STATE_TO_GROUP = {
+    "downloading": GROUP_DOWNLOADING,
+    "forceDL": GROUP_DOWNLOADING,
+    "forcedDL": GROUP_DOWNLOADING,
+    "pausedDL": GROUP_PAUSED,
+    "stalledUP": GROUP_SEEDING,
+    "forcedUP": GROUP_SEEDING,
+    "queuedUP": GROUP_SEEDING,
+}
+
+
+class QBittorrentDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Fetch qBittorrent data once per interval and share it between sensors."""
+
+    def __init__(self, hass: HomeAssistant, client: QBittorrentClient) -> None:
+        """Initialize the coordinator."""
+        self.client = client
+        self._rid = 0
+        self._server_state: dict[str, Any] = {}
+        self._torrents: dict[str, dict[str, Any]] = {}
+        self._totals: tuple[int, ...] | None = None
+        self._torrent_listeners = 0
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=UPDATE_INTERVAL,
+        )
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch the latest data from qBittorrent."""
+        try:
+            data = await self.client.sync_main_data(self._rid)
+        except (ClientError, asyncio.TimeoutError) as err:
+            raise UpdateFailed("Connection lost") from err
+        except LoginRequired as err:
+            raise UpdateFailed("Invalid authentication") from err
+
+        changed = self._merge(data)
+        if not self._torrent_listeners:
+            # No enabled sensor needs the torrent totals
+            self._totals = None
+        elif changed or self._totals is None:
+            # Idle polls only carry server state, so reuse the previous reduction
+            self._totals = reduce_torrents(self._torrents)
+        return summarize(self._server_state, len(self._torrents), self._totals)
+
+    @callback
+    def async_add_torrent_listener(self) -> CALLBACK_TYPE:
+        """Aggregate the torrents on every update until the callback is called."""
+        self._torrent_listeners += 1
+        if self._totals is None and self.data is not None:
+            # The local copy is current, so the totals can be filled in right away
+            self._totals = reduce_torrents(self._torrents)
+            self.data = summarize(
+                self._server_state, len(self._torrents), self._totals
+            )
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the torrent listener."""
+            self._torrent_listeners -= 1
+
+        return remove_listener
+
+    def _merge(self, data: dict[str, Any]) -> bool:
+        """Apply an incremental sync/maindata response to the local copy.
+
+        Returns whether any torrent field used by the sensors changed.
+        """
+        changed = bool(data.get("full_update"))
+        if changed:
+            self._server_state = {}
+            self._torrents = {}
+        self._rid = data["rid"]
+        self._server_state.update(data.get("server_state", {}))
+        for torrent_hash, changes in data.get("torrents", {}).items():
+            torrent = self._torrents.setdefault(torrent_hash, {})
+            for field in TORRENT_FIELDS:
+                if field in changes and torrent.get(field) != changes[field]:
+                    torrent[field] = changes[field]
+                    changed = True
+        for torrent_hash in data.get("torrents_removed", ()):
+            if self._torrents.pop(torrent_hash, None) is not None:
+                changed = True
+        return changed
+
+
+def reduce_torrents(torrents: dict[str, dict[str, Any]]) -> tuple[int, ...]:
+    """Reduce the torrents to their counts, sizes and highest ETA.
+
+    Returns the downloading, seeding and paused counts, the total and
+    downloaded bytes of unfinished torrents and the highest ETA in seconds.
+    """
+    downloading = seeding = paused = 0
+    total = downloaded = 0
+    highest_eta = 0
+    for torrent in torrents.values():
+        group = STATE_TO_GROUP.get(torrent["state"])
+        if group == GROUP_DOWNLOADING:
+            downloading += 1
+            total += torrent["size"]
+            downloaded += torrent["downloaded"]
+        elif group == GROUP_PAUSED:
+            paused += 1
+            total += torrent["size"]
+            downloaded += torrent["downloaded"]
+        elif group == GROUP_SEEDING:
+            seeding += 1
+        eta = torrent["eta"]
+        if eta > highest_eta:
+            highest_eta = eta
+    return downloading, seeding, paused, total, downloaded, highest_eta
+
+
+def summarize(
+    server_state: dict[str, Any],
+    torrent_count: int,
+    totals: tuple[int, ...] | None,
+) -> dict[str, Any]:
+    """Combine the server state and torrent totals into the sensor data."""
+    data = {
+        "dl_info_speed": server_state["dl_info_speed"],
+        "up_info_speed": server_state["up_info_speed"],
+        "total": torrent_count,
+    }
+    if totals is not None:
+        downloading, seeding, paused, total, downloaded, highest_eta = totals
+        data.update(
+            downloading=downloading,
+            seeding=seeding,
+            paused=paused,
+            total_size=total,
+            downloaded=downloaded,
+            highest_eta=highest_eta,
+        )
+    return data
@@ -1,11 +1,98 @@
 """Helper functions for qBittorrent."""
-from qbittorrent.client import Client
+from __future__ import annotations
 
+from typing import Any
 
-def setup_client(url: str, username: str, password: str, verify_ssl: bool) -> Client:
+from aiohttp import ClientSession, CookieJar
+import async_timeout
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.util.json import json_loads
+
+REQUEST_TIMEOUT = 10
+
+
+class LoginRequired(Exception):
+    """Error to indicate qBittorrent rejected the credentials."""
+
+
+class QBittorrentClient:
+    """Minimal asynchronous client for the qBittorrent Web API."""
+
+    def __init__(
+        self, session: ClientSession, url: str, username: str, password: str
+    ) -> None:
+        """Initialize the client."""
+        self._session = session
+        self._url = url.rstrip("/")
+        self._username = username
+        self._password = password
+
+    async def login(self) -> None:
+        """Log in and keep the session cookie for later requests."""
+        async with async_timeout.timeout(REQUEST_TIMEOUT), self._session.post(
+            f"{self._url}/api/v2/auth/login",
+            data={"username": self._username, "password": self._password},
+            headers={"Referer": self._url},
+        ) as resp:
+            resp.raise_for_status()
+            if await resp.text() != "Ok.":
+                raise LoginRequired
+
+    async def close(self) -> None:
+        """Close the underlying session."""
+        await self._session.close()
+
+    async def get_alternative_speed_status(self) -> bool:
+        """Return whether the alternative speed limits are enabled."""
+        return await self._request("transfer/speedLimitsMode") == "1"
+
+    async def sync_main_data(self, rid: int = 0) -> dict[str, Any]:
+        """Return the changes to the server state and torrents since rid."""
+        return await self._request("sync/maindata", {"rid": rid}, json=True)
+
+    async def _request(
+        self, path: str, params: dict[str, Any] | None = None, json: bool = False
+    ) -> Any:
+        """Perform a GET request, logging in again once if the session expired."""
+        try:
+            return await self._get(path, params, json)
+        except LoginRequired:
+            # The SID cookie is dropped when qBittorrent restarts
+            await self.login()
+            return await self._get(path, params, json)
+
+    async def _get(self, path: str, params: dict[str, Any] | None, json: bool) -> Any:
+        """Perform a GET request against the Web API."""
+        async with async_timeout.timeout(REQUEST_TIMEOUT), self._session.get(
+            f"{self._url}/api/v2/{path}", params=params
+        ) as resp:
+            if resp.status == 403:
+                raise LoginRequired
+            resp.raise_for_status()
+            if json:
+                return json_loads(await resp.read())
+            return await resp.text()
+
+
+async def setup_client(
+    hass: HomeAssistant, url: str, username: str, password: str, verify_ssl: bool
+) -> QBittorrentClient:
     """Create a qBittorrent client."""
-    client = Client(url, verify=verify_ssl)
-    client.login(username, password)
-    # Get an arbitrary attribute to test if connection succeeds
-    client.get_alternative_speed_status()
+    # qBittorrent authenticates with a session cookie, so use a dedicated
+    # session rather than sharing Home Assistant's cookie jar. The jar must be
+    # unsafe to keep cookies from IP address hosts such as the default URL.
+    # The caller owns the returned client and must close it when done.
+    session = async_create_clientsession(
+        hass, verify_ssl, auto_cleanup=False, cookie_jar=CookieJar(unsafe=True)
+    )
+    client = QBittorrentClient(session, url, username, password)
+    try:
+        await client.login()
+        # Get an arbitrary attribute to test if connection succeeds
+        await client.get_alternative_speed_status()
+    except BaseException:
+        await client.close()
+        raise
     return client
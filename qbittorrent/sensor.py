@@ -1,10 +1,11 @@
 """Support for monitoring the qBittorrent API."""
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
 import logging
+from typing import Any
 
-from qbittorrent.client import Client, LoginRequired
-from requests.exceptions import RequestException
 import voluptuous as vol
 
 from homeassistant.components.sensor import (
@@ -20,8 +21,8 @@ from homeassistant.const import (
     CONF_PASSWORD,
     CONF_URL,
     CONF_USERNAME,
-    STATE_IDLE,
     PERCENTAGE,
+    STATE_IDLE,
     TIME_MINUTES,
     UnitOfDataRate,
 )
@@ -29,9 +30,11 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers import issue_registry as ir
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType, StateType
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DEFAULT_NAME, DOMAIN
+from .coordinator import QBittorrentDataCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -45,66 +48,115 @@ SENSOR_TYPE_SEED_NUMBER = "number_seeding"
 SENSOR_TYPE_PAUSED_NUMBER = "number_paused"
 SENSOR_TYPE_DOWNLOAD_PERCENT = "download_percent"
 
-SENSOR_TYPES: tuple[SensorEntityDescription, ...] = (
-    SensorEntityDescription(
+
+def format_speed(speed):
+    """Return a bytes/s measurement as a human readable string."""
+    # speed / 1024 < 0.1 KiB/s is the same as speed < 102.4 B/s
+    return round(speed / 1024, 2 if speed < 102.4 else 1)
+
+
+def get_current_status(data: dict[str, Any]) -> str:
+    """Return the transfer status from the current speeds."""
+    download = data["dl_info_speed"]
+    upload = data["up_info_speed"]
+    if upload > 0 and download > 0:
+        return "up_down"
+    if upload > 0 and download == 0:
+        return "seeding"
+    if upload == 0 and download > 0:
+        return "downloading"
+    return STATE_IDLE
+
+
+def get_download_percent(data: dict[str, Any]) -> float:
+    """Return how much of the unfinished torrents has been downloaded."""
+    if data["total_size"] == 0:
+        return 0
+    return round(data["downloaded"] / data["total_size"] * 100, 2)
+
+
+@dataclass
+class QBittorrentMixin:
+    """Mixin for required keys."""
+
+    value_fn: Callable[[dict[str, Any]], StateType]
+
+
+@dataclass
+class QBittorrentSensorEntityDescription(SensorEntityDescription, QBittorrentMixin):
+    """Describes a qBittorrent sensor entity."""
+
+    uses_torrents: bool = False
+
+
+SENSOR_TYPES: tuple[QBittorrentSensorEntityDescription, ...] = (
+    QBittorrentSensorEntityDescription(
         key=SENSOR_TYPE_CURRENT_STATUS,
         name="Status",
+        value_fn=get_current_status,
     ),
-    SensorEntityDescription(
+    QBittorrentSensorEntityDescription(
         key=SENSOR_TYPE_DOWNLOAD_SPEED,
         name="Down Speed",
         icon="mdi:cloud-download",
         device_class=SensorDeviceClass.DATA_RATE,
         native_unit_of_measurement=UnitOfDataRate.KIBIBYTES_PER_SECOND,
         state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: format_speed(data["dl_info_speed"]),
     ),
-    SensorEntityDescription(
+    QBittorrentSensorEntityDescription(
         key=SENSOR_TYPE_UPLOAD_SPEED,
         name="Up Speed",
         icon="mdi:cloud-upload",
         device_class=SensorDeviceClass.DATA_RATE,
         native_unit_of_measurement=UnitOfDataRate.KIBIBYTES_PER_SECOND,
         state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda data: format_speed(data["up_info_speed"]),
     ),
-        SensorEntityDescription(
+    QBittorrentSensorEntityDescription(
         key=SENSOR_TYPE_TOTAL_NUMBER,
         name="Total Torrents",
-        icon="mdi:cloud-upload"
+        icon="mdi:cloud-upload",
+        value_fn=lambda data: data["total"],
     ),
-        SensorEntityDescription(
+    QBittorrentSensorEntityDescription(
         key=SENSOR_TYPE_HIGHEST_ETA,
         name="Highest ETA",
         icon="mdi:cloud-upload",
-
         native_unit_of_measurement=TIME_MINUTES,
         state_class=SensorStateClass.MEASUREMENT,
+        uses_torrents=True,
+        value_fn=lambda data: round(data["highest_eta"] / 60, 2),
     ),
-        SensorEntityDescription(
+    QBittorrentSensorEntityDescription(
         key=SENSOR_TYPE_DOWNLOAD_NUMBER,
         name="Torrents Downloading",
         icon="mdi:cloud-upload",
-
+        uses_torrents=True,
+        value_fn=lambda data: data["downloading"],
     ),
-       SensorEntityDescription(
+    QBittorrentSensorEntityDescription(
         key=SENSOR_TYPE_SEED_NUMBER,
         name="Torrents Seeding",
         icon="mdi:cloud-upload",
-
+        uses_torrents=True,
+        value_fn=lambda data: data["seeding"],
     ),
-       SensorEntityDescription(
+    QBittorrentSensorEntityDescription(
         key=SENSOR_TYPE_PAUSED_NUMBER,
         name="Torrents Paused",
         icon="mdi:cloud-upload",
-
+        uses_torrents=True,
+        value_fn=lambda data: data["paused"],
     ),
-       SensorEntityDescription(
+    QBittorrentSensorEntityDescription(
         key=SENSOR_TYPE_DOWNLOAD_PERCENT,
         name="Download Percentage",
         icon="mdi:cloud-upload",
-        native_unit_of_measurement=PERCENTAGE
-
+        native_unit_of_measurement=PERCENTAGE,
+        uses_torrents=True,
+        value_fn=get_download_percent,
     ),
-
 )
 
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
@@ -146,96 +198,41 @@ async def async_setup_entry(
     async_add_entites: AddEntitiesCallback,
 ) -> None:
     """Set up qBittorrent sensor entries."""
-    client: Client = hass.data[DOMAIN][config_entry.entry_id]
-    entities = [
-        QBittorrentSensor(description, client, config_entry)
-        for description in SENSOR_TYPES
-    ]
-    async_add_entites(entities, True)
-
-
-def format_speed(speed):
-    """Return a bytes/s measurement as a human readable string."""
-    kb_spd = float(speed) / 1024
-    return round(kb_spd, 2 if kb_spd < 0.1 else 1)
+    coordinator: QBittorrentDataCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    async_add_entites(
+        (
+            QBittorrentSensor(description, coordinator, config_entry)
+            for description in SENSOR_TYPES
+        ),
+        update_before_add=False,
+    )
 
 
-class QBittorrentSensor(SensorEntity):
+class QBittorrentSensor(CoordinatorEntity[QBittorrentDataCoordinator], SensorEntity):
     """Representation of an qBittorrent sensor."""
 
+    entity_description: QBittorrentSensorEntityDescription
+
     def __init__(
         self,
-        description: SensorEntityDescription,
-        qbittorrent_client: Client,
+        description: QBittorrentSensorEntityDescription,
+        coordinator: QBittorrentDataCoordinator,
         config_entry: ConfigEntry,
     ) -> None:
         """Initialize the qBittorrent sensor."""
+        super().__init__(coordinator)
         self.entity_description = description
-        self.client = qbittorrent_client
 
         self._attr_unique_id = f"{config_entry.entry_id}-{description.key}"
         self._attr_name = f"{config_entry.title} {description.name}"
-        self._attr_available = False
-
-    def update(self) -> None:
-        """Get the latest data from qBittorrent and updates the state."""
-        try:
-            data = self.client.sync_main_data()
-            torrents = data["torrents"]
-            self._attr_available = True
-        except RequestException:
-            _LOGGER.error("Connection lost")
-            self._attr_available = False
-            return
-        except LoginRequired:
-            _LOGGER.error("Invalid authentication")
-            return
-
-        if data is None:
-            return
-
-        download = data["server_state"]["dl_info_speed"]
-        upload = data["server_state"]["up_info_speed"]
-
-        sensor_type = self.entity_description.key
-        if sensor_type == SENSOR_TYPE_CURRENT_STATUS:
-            if upload > 0 and download > 0:
-                self._attr_native_value = "up_down"
-            elif upload > 0 and download == 0:
-                self._attr_native_value = "seeding"
-            elif upload == 0 and download > 0:
-                self._attr_native_value = "downloading"
-            else:
-                self._attr_native_value = STATE_IDLE
-        elif sensor_type == SENSOR_TYPE_TOTAL_NUMBER:
-            self._attr_native_value = len(data["torrents"])
-        elif sensor_type == SENSOR_TYPE_DOWNLOAD_NUMBER:
-            downloading = [n for n in torrents if torrents[n]["state"] == "downloading" or torrents[n]["state"] == "forceDL"]
-            self._attr_native_value = len(downloading)
-        elif sensor_type == SENSOR_TYPE_SEED_NUMBER:
-            seeding = [n for n in torrents if torrents[n]["state"] == "stalledUP" or torrents[n]["state"] == "forcedUP" or torrents[n]["state"] == "queuedUP"]
-            self._attr_native_value = len(seeding)
-        elif sensor_type == SENSOR_TYPE_DOWNLOAD_PERCENT:
-            total = 0
-            downloaded = 0
-            percentage = 0
-            for n in torrents:
-                if torrents[n]["state"] == "downloading" or torrents[n]["state"] == "forcedDL" or torrents[n]["state"] == "pausedDL":
-                    total = total + torrents[n]["size"]
-                    downloaded = downloaded + torrents[n]["downloaded"]
-            if total != 0: percentage = round(downloaded / total * 100, 2)
-            self._attr_native_value = percentage
-        elif sensor_type == SENSOR_TYPE_PAUSED_NUMBER:
-            paused = [n for n in torrents if torrents[n]["state"] == "pausedDL"]
-            self._attr_native_value = len(paused)
-        elif sensor_type == SENSOR_TYPE_HIGHEST_ETA:
-            torrents = data["torrents"]
-            highest_eta = 0
-            for torrent in torrents:
-                if (torrents[torrent]["eta"] > highest_eta):
-                    highest_eta = round(torrents[torrent]["eta"] / 60 , 2)
-            self._attr_native_value = highest_eta
-        elif sensor_type == SENSOR_TYPE_DOWNLOAD_SPEED:
-            self._attr_native_value = format_speed(download)
-        elif sensor_type == SENSOR_TYPE_UPLOAD_SPEED:
-            self._attr_native_value = format_speed(upload)
+
+    async def async_added_to_hass(self) -> None:
+        """Register the sensor with the coordinator."""
+        await super().async_added_to_hass()
+        if self.entity_description.uses_torrents:
+            self.async_on_remove(self.coordinator.async_add_torrent_listener())
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the value of the sensor."""
+        return self.entity_description.value_fn(self.coordinator.data)